@@ -1,32 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException
+import threading
+from collections import OrderedDict
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from functools import lru_cache
 from sqlalchemy.orm import Session
 from typing import Dict, Any
-import json
-from app.core.db import get_db
-from app.models.schemas import ArticleJobCreate, ArticleJob, JobStatus, Language, SERPResult, SERPAnalysis, Outline, Article
+from app.core.db import get_db, SessionLocal
+from app.models.schemas import (
+    ArticleJobCreate, ArticleJob, JobStatus, Language, SERPAnalysis,
+    Outline, Article, SERP_RESULTS_ADAPTER
+)
 from app.models.orm import create_job, get_job
 from app.domain.pipeline import process_job
-from app.services.serp_client import SerpClient
-from app.services.llm_client import LLMClient
-from app.services.seo_validator import SEOValidator
-from app.services.link_planner import LinkPlanner
-from app.core.config import settings
+from app.core.config import get_settings
 
 router = APIRouter()
 
-def get_serp_client() -> SerpClient:
-    return SerpClient(api_key=settings.serpapi_api_key)
-
-
-def get_llm_client() -> LLMClient:
-    return LLMClient(api_key=settings.openai_api_key)
+# Services are process-wide singletons: rebuilding an LLMClient (and its
+# underlying httpx client) per request would defeat connection pooling.
+# Their modules are imported inside the factories so the heavy SDK imports
+# stay off the cold-start path.
+@lru_cache(maxsize=1)
+def get_serp_client():
+    from app.services.serp_client import SerpClient
+    return SerpClient(api_key=get_settings().serpapi_api_key)
+
+
+@lru_cache(maxsize=1)
+def get_llm_client():
+    from app.services.llm_client import LLMClient
+    settings = get_settings()
+    return LLMClient(
+        api_key=settings.openai_api_key,
+        concurrency=settings.openai_concurrency
+    )
 
 
-def get_seo_validator() -> SEOValidator:
+@lru_cache(maxsize=1)
+def get_seo_validator():
+    from app.services.seo_validator import SEOValidator
     return SEOValidator()
 
 
-def get_link_planner() -> LinkPlanner:
+@lru_cache(maxsize=1)
+def get_link_planner():
+    from app.services.link_planner import LinkPlanner
     return LinkPlanner()
 
 
@@ -40,23 +57,30 @@ def get_services() -> Dict[str, Any]:
 
 
 @router.post("/jobs", response_model=ArticleJob, status_code=201)
-def create_article_job(
+async def create_article_job(
     job_input: ArticleJobCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     services: Dict[str, Any] = Depends(get_services)) -> ArticleJob:
 
     job = create_job(db, job_input)
-    
+
+    background_tasks.add_task(_run_job, job.id, services)
+
+    return _job_to_response(job)
+
+
+async def _run_job(job_id: str, services: Dict[str, Any]) -> None:
+    # The request-scoped session closes when the response returns,
+    # so the background task opens its own.
+    db = SessionLocal()
     try:
-        process_job(job.id, db, services)
-    except Exception as e:
+        await process_job(job_id, db, services)
+    except Exception:
+        # Failure state is already persisted on the job row by process_job
         pass
-    
-    job = get_job(db, job.id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    return _job_to_response(job)
+    finally:
+        db.close()
 
 
 @router.get("/jobs/{job_id}", response_model=ArticleJob)
@@ -70,13 +94,31 @@ def get_article_job(
     return _job_to_response(job)
 
 
+# Parsed responses keyed by (id, updated_at): polling clients re-fetch the
+# same completed job many times, and re-validating tens of KB of article
+# JSON on every GET is wasted work when the row has not changed.
+# The sync GET handler runs on AnyIO worker threads while the async POST
+# handler touches the cache from the event loop, so the compound
+# get/move_to_end and insert/evict operations go through the lock.
+_response_cache: OrderedDict = OrderedDict()
+_RESPONSE_CACHE_MAX = 128
+_response_cache_lock = threading.Lock()
+
+
 def _job_to_response(job) -> ArticleJob:
     from app.models.schemas import ArticleJobCreate, Language
-    
+
+    cache_key = (job.id, job.updated_at)
+    with _response_cache_lock:
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            _response_cache.move_to_end(cache_key)
+    if cached is not None:
+        return cached
+
     serp_results = None
     if job.serp_results_json:
-        serp_data = json.loads(job.serp_results_json)
-        serp_results = [SERPResult(**r) for r in serp_data]
+        serp_results = SERP_RESULTS_ADAPTER.validate_json(job.serp_results_json)
     
     serp_analysis = None
     if job.serp_analysis_json:
@@ -90,7 +132,7 @@ def _job_to_response(job) -> ArticleJob:
     if job.article_json:
         article = Article.model_validate_json(job.article_json)
     
-    return ArticleJob(
+    response = ArticleJob(
         id=job.id,
         input=ArticleJobCreate(
             topic=job.topic,
@@ -105,3 +147,10 @@ def _job_to_response(job) -> ArticleJob:
         article=article
     )
 
+    with _response_cache_lock:
+        _response_cache[cache_key] = response
+        if len(_response_cache) > _RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+
+    return response
+
@@ -1,17 +1,22 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
 
 class Settings(BaseSettings):
-    
+
     openai_api_key: str
     serpapi_api_key: str
     database_url: str = "sqlite:///./seo_engine.db"
-    
+    openai_concurrency: int = 4
+
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse .env and the environment once, on first use rather than import."""
+    return Settings()
 
@@ -1,14 +1,28 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from typing import Generator
-from app.core.config import settings
+from app.core.config import get_settings
 
 engine = create_engine(
-    settings.database_url,
+    get_settings().database_url,
     connect_args={"check_same_thread": False}
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL lets GET /jobs readers proceed while a pipeline commit is in
+    # flight, and synchronous=NORMAL batches fsyncs instead of paying one
+    # per commit. busy_timeout avoids immediate "database is locked"
+    # errors under concurrent jobs.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
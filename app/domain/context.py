@@ -1,19 +1,26 @@
+from dataclasses import dataclass, field
 from typing import List, Optional
-from pydantic import BaseModel
 from app.models.schemas import (
     ArticleJobCreate,
     SERPResult,
     SERPAnalysis,
+    SEOMetadata,
     Outline,
     Article
 )
 
 
-class ArticleContext(BaseModel):
+@dataclass(slots=True)
+class ArticleContext:
+    """Mutable state threaded through the agent pipeline.
+
+    Internal-only and never serialized, so a plain dataclass avoids the
+    pydantic validation cost on every agent's field assignments.
+    """
     job_id: str
     input: ArticleJobCreate
-    serp_results: List[SERPResult] = []
+    serp_results: List[SERPResult] = field(default_factory=list)
     serp_analysis: Optional[SERPAnalysis] = None
+    seo_metadata: Optional[SEOMetadata] = None
     outline: Optional[Outline] = None
     article: Optional[Article] = None
-
@@ -1,29 +1,28 @@
-import json
 from typing import Dict, Any
 from sqlalchemy.orm import Session
 from app.domain.context import ArticleContext
 from app.domain.agents import (
     SERPAgent,
-    SERPAnalysisAgent,
-    OutlineAgent,
+    PlanAgent,
     DraftAgent,
     ValidationAgent
 )
-from app.models.orm import get_job, update_job_status_and_data
-from app.models.schemas import JobStatus, SERPResult, SERPAnalysis, Outline, Article
+from app.models.orm import get_job, set_job_data
+from app.models.schemas import (
+    JobStatus, SERPAnalysis, Outline, Article, SERP_RESULTS_ADAPTER
+)
 
 
 def build_pipeline(serp_client, llm_client, seo_validator, link_planner) -> list:
     return [
         SERPAgent(serp_client),
-        SERPAnalysisAgent(llm_client),
-        OutlineAgent(llm_client),
+        PlanAgent(llm_client),
         DraftAgent(llm_client),
         ValidationAgent(seo_validator, link_planner)
     ]
 
 
-def process_job(job_id: str, db: Session, services: Dict[str, Any]) -> None:
+async def process_job(job_id: str, db: Session, services: Dict[str, Any]) -> None:
     job = get_job(db, job_id)
     if not job:
         raise ValueError(f"Job {job_id} not found")
@@ -33,8 +32,11 @@ def process_job(job_id: str, db: Session, services: Dict[str, Any]) -> None:
     if job.status == JobStatus.failed.value:
         return
     
-    update_job_status_and_data(db, job_id, JobStatus.running)
-    
+    # Updates below are assigned on the loaded instance and committed once
+    # at the terminal state; each intermediate commit would cost a SELECT
+    # plus an fsync.
+    set_job_data(job, JobStatus.running)
+
     try:
         from app.models.schemas import ArticleJobCreate, Language
         
@@ -48,8 +50,7 @@ def process_job(job_id: str, db: Session, services: Dict[str, Any]) -> None:
         )
 
         if job.serp_results_json:
-            serp_data = json.loads(job.serp_results_json)
-            ctx.serp_results = [SERPResult(**r) for r in serp_data]
+            ctx.serp_results = SERP_RESULTS_ADAPTER.validate_json(job.serp_results_json)
         
         if job.serp_analysis_json:
             ctx.serp_analysis = SERPAnalysis.model_validate_json(job.serp_analysis_json)
@@ -68,45 +69,42 @@ def process_job(job_id: str, db: Session, services: Dict[str, Any]) -> None:
         )
         
         for agent in agents:
-            ctx = agent.run(ctx)
-            
+            ctx = await agent.run(ctx)
+
             if isinstance(agent, SERPAgent) and ctx.serp_results:
-                update_job_status_and_data(
-                    db, job_id, JobStatus.running,
+                set_job_data(
+                    job, JobStatus.running,
                     serp_results=ctx.serp_results
                 )
-            
-            elif isinstance(agent, SERPAnalysisAgent) and ctx.serp_analysis:
-                update_job_status_and_data(
-                    db, job_id, JobStatus.running,
-                    serp_analysis=ctx.serp_analysis
-                )
-            
-            elif isinstance(agent, OutlineAgent) and ctx.outline:
-                update_job_status_and_data(
-                    db, job_id, JobStatus.running,
+
+            elif isinstance(agent, PlanAgent) and ctx.serp_analysis and ctx.outline:
+                set_job_data(
+                    job, JobStatus.running,
+                    serp_analysis=ctx.serp_analysis,
                     outline=ctx.outline
                 )
-            
+
             elif isinstance(agent, DraftAgent) and ctx.article:
-                update_job_status_and_data(
-                    db, job_id, JobStatus.running,
+                set_job_data(
+                    job, JobStatus.running,
                     article=ctx.article
                 )
-            
+
             elif isinstance(agent, ValidationAgent) and ctx.article:
-                update_job_status_and_data(
-                    db, job_id, JobStatus.running,
+                set_job_data(
+                    job, JobStatus.running,
                     article=ctx.article
                 )
-        
-        update_job_status_and_data(db, job_id, JobStatus.completed, article=ctx.article)
-        
+
+        set_job_data(job, JobStatus.completed, article=ctx.article)
+        db.commit()
+
     except Exception as e:
         error_message = str(e)
-        update_job_status_and_data(
-            db, job_id, JobStatus.failed,
+        set_job_data(
+            job, JobStatus.failed,
             error_message=error_message
         )
+        db.commit()
         raise
 
@@ -1,12 +1,14 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Column, String, Integer, DateTime, Text
+from sqlalchemy import Column, String, Integer, DateTime, Text, LargeBinary
 from sqlalchemy.orm import Session
 import uuid
-import json
 
 from app.core.db import Base
-from app.models.schemas import ArticleJobCreate, JobStatus, SERPResult, SERPAnalysis, Outline, Article
+from app.models.schemas import (
+    ArticleJobCreate, JobStatus, SERPResult, SERPAnalysis, Outline, Article,
+    SERP_RESULTS_ADAPTER
+)
 
 
 class Job(Base):
@@ -19,10 +21,12 @@ class Job(Base):
     status = Column(String, nullable=False, default=JobStatus.pending.value)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
-    serp_results_json = Column(Text, nullable=True)
-    serp_analysis_json = Column(Text, nullable=True)
-    outline_json = Column(Text, nullable=True)
-    article_json = Column(Text, nullable=True)
+    # JSON payloads are stored as raw UTF-8 bytes: pydantic-core accepts
+    # bytes in model_validate_json, so reads skip a str decode round-trip.
+    serp_results_json = Column(LargeBinary, nullable=True)
+    serp_analysis_json = Column(LargeBinary, nullable=True)
+    outline_json = Column(LargeBinary, nullable=True)
+    article_json = Column(LargeBinary, nullable=True)
     error_message = Column(Text, nullable=True)
 
 
@@ -41,42 +45,40 @@ def create_job(db: Session, job_input: ArticleJobCreate) -> Job:
 
 
 def get_job(db: Session, job_id: str) -> Optional[Job]:
-    return db.query(Job).filter(Job.id == job_id).first()
+    # Primary-key lookup through the identity map: repeated fetches in the
+    # same session return the cached instance without issuing SQL.
+    return db.get(Job, job_id)
 
 
-def update_job_status_and_data(
-    db: Session,
-    job_id: str,
+def set_job_data(
+    job: Job,
     status: JobStatus,
     serp_results: Optional[List[SERPResult]] = None,
     serp_analysis: Optional[SERPAnalysis] = None,
     outline: Optional[Outline] = None,
     article: Optional[Article] = None,
     error_message: Optional[str] = None
-) -> Job:
-    job = get_job(db, job_id)
-    if not job:
-        raise ValueError(f"Job {job_id} not found")
-    
+) -> None:
+    """Assign status and serialized payloads on the instance without committing.
+
+    Callers decide when to commit, so a pipeline can batch several updates
+    into a single transaction instead of paying one fsync per step.
+    """
     job.status = status.value
     job.updated_at = datetime.utcnow()
-    
+
     if serp_results is not None:
-        job.serp_results_json = json.dumps([r.model_dump() for r in serp_results], default=str)
-    
+        job.serp_results_json = SERP_RESULTS_ADAPTER.dump_json(serp_results)
+
     if serp_analysis is not None:
-        job.serp_analysis_json = serp_analysis.model_dump_json()
-    
+        job.serp_analysis_json = serp_analysis.model_dump_json().encode()
+
     if outline is not None:
-        job.outline_json = outline.model_dump_json()
-    
+        job.outline_json = outline.model_dump_json().encode()
+
     if article is not None:
-        job.article_json = article.model_dump_json()
-    
+        job.article_json = article.model_dump_json().encode()
+
     if error_message is not None:
         job.error_message = error_message
-    
-    db.commit()
-    db.refresh(job)
-    return job
 
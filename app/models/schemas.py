@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import List, Optional
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, HttpUrl, Field, TypeAdapter
 
 
 class Language(str, Enum):
@@ -40,6 +40,18 @@ class Outline(BaseModel):
     sections: List[OutlineSection] = Field(default_factory=list)
 
 
+class SEOMetadata(BaseModel):
+    title_tag: str
+    meta_description: str
+
+
+class Plan(BaseModel):
+    """Combined output of the single planning LLM call."""
+    analysis: SERPAnalysis
+    outline: Outline
+    seo: SEOMetadata
+
+
 class InternalLinkSuggestion(BaseModel):
     anchor_text: str
     target_slug: str
@@ -86,3 +98,8 @@ class ArticleJob(BaseModel):
     outline: Optional[Outline] = None
     article: Optional[Article] = None
 
+
+# Module-level adapter so the list schema is built once and reused for
+# every serialize/validate of SERP result payloads.
+SERP_RESULTS_ADAPTER = TypeAdapter(List[SERPResult])
+
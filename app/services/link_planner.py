@@ -1,8 +1,9 @@
-from typing import List
+import re
+from typing import List, Set
 from app.models.schemas import (
-    Article, 
-    SERPAnalysis, 
-    SERPResult, 
+    Article,
+    SERPAnalysis,
+    SERPResult,
     Outline,
     InternalLinkSuggestion,
     ExternalReference
@@ -14,30 +15,41 @@ class LinkPlanner:
         {"slug": "content-optimization-checklist", "topic": "content optimization checklist"},
         {"slug": "remote-team-collaboration", "topic": "remote team collaboration tips"},
     ]
-    
+
+    def __init__(self):
+        # The page keywords are static, so build one alternation over all of
+        # them once. A single finditer pass over the article text then finds
+        # every keyword hit, instead of scanning the full text once per
+        # page keyword.
+        keyword_slugs = {}
+        for page in self.INTERNAL_PAGES:
+            for keyword in page["topic"].lower().split():
+                keyword_slugs.setdefault(keyword, set()).add(page["slug"])
+        self._keyword_slugs = keyword_slugs
+        self._keyword_pattern = re.compile("|".join(
+            re.escape(k) for k in sorted(keyword_slugs, key=len, reverse=True)
+        ))
+
+    def _matched_slugs(self, text_lower: str) -> Set[str]:
+        return {
+            slug
+            for match in self._keyword_pattern.finditer(text_lower)
+            for slug in self._keyword_slugs[match.group(0)]
+        }
+
     def plan_internal_links(
-        self, 
-        article: Article, 
+        self,
+        article: Article,
         serp_analysis: SERPAnalysis
     ) -> List[InternalLinkSuggestion]:
         suggestions = []
         article_text_lower = (article.h1 + " " + article.body_markdown).lower()
-        
+        topics_text_lower = "\n".join(t.lower() for t in serp_analysis.topics)
+
+        matched = self._matched_slugs(article_text_lower) | self._matched_slugs(topics_text_lower)
+
         for page in self.INTERNAL_PAGES:
-            page_topic_lower = page["topic"].lower()
-            page_keywords = set(page_topic_lower.split())
-            
-            matches_serp = any(
-                any(keyword in topic.lower() for keyword in page_keywords)
-                for topic in serp_analysis.topics
-            )
-            
-            matches_article = any(
-                keyword in article_text_lower 
-                for keyword in page_keywords
-            )
-            
-            if matches_serp or matches_article:
+            if page["slug"] in matched:
                 suggestions.append(
                     InternalLinkSuggestion(
                         anchor_text=page["topic"],
@@ -76,18 +88,22 @@ class LinkPlanner:
         ]
         
         selected_results = authoritative_results[:4] if authoritative_results else serp_results[:4]
-        
+
+        # The section keyword sets are invariant across results, so build
+        # them once instead of re-splitting every heading and summary for
+        # each SERP result.
+        section_keywords = [
+            (section, set(section.heading.lower().split()) | set(section.summary.lower().split()))
+            for section in outline.sections
+        ]
+
         for result in selected_results:
             best_section = None
             best_match_score = 0
-            
+
             result_keywords = set(result.title.lower().split())
-            
-            for section in outline.sections:
-                section_keywords = set(section.heading.lower().split())
-                section_summary_keywords = set(section.summary.lower().split())
-                all_section_keywords = section_keywords | section_summary_keywords
-                
+
+            for section, all_section_keywords in section_keywords:
                 overlap = len(result_keywords & all_section_keywords)
                 if overlap > best_match_score:
                     best_match_score = overlap
@@ -0,0 +1,43 @@
+import hashlib
+import os
+import orjson
+from pathlib import Path
+from typing import Any, Optional
+
+
+class LLMCache:
+    """Deterministic on-disk cache for LLM responses.
+
+    Identical prompts are the most expensive thing this service replays, so
+    responses are cached as one JSON file per key, where the key is the
+    SHA-256 of the model, system prompt, and user prompt. The cache is off
+    by default and enabled with LLM_CACHE_ENABLED=1.
+    """
+
+    def __init__(self, cache_dir: str = "./.llm_cache"):
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.environ.get("LLM_CACHE_ENABLED") == "1"
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str) -> str:
+        raw = f"{model}|{system_prompt}|{user_prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self.cache_dir / f"{key}.json"
+        try:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(value))
+        tmp_path.replace(path)
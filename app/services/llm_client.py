@@ -1,51 +1,140 @@
-import json
+import asyncio
+import random
 from typing import Dict
-from openai import OpenAI
+import httpx
+import orjson
+from app.services.llm_cache import LLMCache
+
+# Shared transport so every LLMClient reuses the same connection pool.
+# HTTP/2 multiplexes concurrent calls over a single connection instead
+# of paying a TCP+TLS handshake per request.
+_http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=64,
+        max_keepalive_connections=32,
+        keepalive_expiry=30.0
+    ),
+    timeout=httpx.Timeout(60.0)
+)
+
+_JSON_SYSTEM_PROMPT = "You are a helpful assistant that returns only valid JSON."
+_TEXT_SYSTEM_PROMPT = "You are a helpful assistant that writes high-quality, SEO-optimized content."
+
+_cache = LLMCache()
 
 
 class LLMClient:
-    
-    def __init__(self, api_key: str, model: str = "gpt-5-mini-2025-08-07"):
-        self.client = OpenAI(api_key=api_key)
+
+    def __init__(self, api_key: str, model: str = "gpt-5-mini-2025-08-07", concurrency: int = 4):
+        # Deferred import: the openai SDK dominates cold-start time, and
+        # nothing needs it until a client is actually constructed.
+        from openai import AsyncOpenAI
+
+        self.client = AsyncOpenAI(api_key=api_key, http_client=_http_client)
         self.model = model
-    
-    def generate_json(self, prompt: str, schema_hint: str = "") -> Dict:
+        # Bound the number of in-flight completions so a burst of concurrent
+        # jobs queues locally instead of tripping OpenAI rate limits.
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._max_retries = 3
+
+    async def _create(self, **kwargs):
+        """Run one completion under the concurrency bound with retries.
+
+        For stream=True the stream is drained here and the joined text
+        returned: a streaming create() resolves as soon as headers
+        arrive, so releasing the semaphore then would leave the longest
+        part of the generation unbounded, and a RateLimitError raised
+        mid-stream would skip the backoff.
+        """
+        from openai import RateLimitError
+
+        streaming = kwargs.get("stream", False)
+        delay = 1.0
+        for attempt in range(self._max_retries + 1):
+            async with self._semaphore:
+                try:
+                    response = await self.client.chat.completions.create(**kwargs)
+                    if not streaming:
+                        return response
+                    chunks = []
+                    async for part in response:
+                        if part.choices and part.choices[0].delta.content:
+                            chunks.append(part.choices[0].delta.content)
+                    return "".join(chunks)
+                except RateLimitError:
+                    if attempt == self._max_retries:
+                        raise
+            # Exponential backoff with jitter, outside the semaphore so
+            # other calls can proceed while this one waits.
+            await asyncio.sleep(delay + random.uniform(0, delay / 2))
+            delay *= 2
+
+    async def generate_json(self, prompt: str, schema_hint: str = "", force_refresh: bool = False) -> Dict:
         try:
             full_prompt = prompt
             if schema_hint:
                 full_prompt += f"\n\nReturn only valid JSON matching this structure: {schema_hint}"
             else:
                 full_prompt += "\n\nReturn only valid JSON, no other text."
-            
-            response = self.client.chat.completions.create(
+
+            cache_key = None
+            if _cache.enabled():
+                cache_key = _cache.make_key(self.model, _JSON_SYSTEM_PROMPT, full_prompt)
+                if not force_refresh:
+                    cached = _cache.get(cache_key)
+                    if cached is not None:
+                        return cached
+
+            response = await self._create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that returns only valid JSON."},
+                    {"role": "system", "content": _JSON_SYSTEM_PROMPT},
                     {"role": "user", "content": full_prompt}
                 ],
                 response_format={"type": "json_object"}
             )
-            
+
             content = response.choices[0].message.content
-            return json.loads(content)
-            
-        except json.JSONDecodeError as e:
+            result = orjson.loads(content)
+
+            if cache_key is not None:
+                _cache.set(cache_key, result)
+
+            return result
+
+        except orjson.JSONDecodeError as e:
             raise Exception(f"Failed to parse JSON response: {str(e)}")
         except Exception as e:
             raise Exception(f"OpenAI API call failed: {str(e)}")
-    
-    def generate_text(self, prompt: str) -> str:
+
+    async def generate_text(self, prompt: str, force_refresh: bool = False) -> str:
         try:
-            response = self.client.chat.completions.create(
+            cache_key = None
+            if _cache.enabled():
+                cache_key = _cache.make_key(self.model, _TEXT_SYSTEM_PROMPT, prompt)
+                if not force_refresh:
+                    cached = _cache.get(cache_key)
+                    if cached is not None:
+                        return cached
+
+            # Stream the completion: tokens start arriving immediately and
+            # accumulate while any concurrent calls (e.g. the SEO metadata
+            # leg in DraftAgent) are still in flight. _create drains the
+            # stream and returns the joined text.
+            content = await self._create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "You are a helpful assistant that writes high-quality, SEO-optimized content."},
+                    {"role": "system", "content": _TEXT_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
-                ]
+                ],
+                stream=True
             )
-            
-            return response.choices[0].message.content
-            
+
+            if cache_key is not None:
+                _cache.set(cache_key, content)
+
+            return content
+
         except Exception as e:
             raise Exception(f"OpenAI API call failed: {str(e)}")
-
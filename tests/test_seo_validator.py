@@ -4,6 +4,11 @@ from app.services.seo_validator import SEOValidator
 from pydantic import HttpUrl
 
 
+# Shared word pool built once per test session; article bodies are
+# assembled from slices of it instead of re-multiplying strings per test.
+_LOREM_WORDS = ("Some content here. " * 3334).split()
+
+
 def create_test_article(
     h1: str = "Test Article",
     body: str = "This is a test article body.",
@@ -11,21 +16,29 @@ def create_test_article(
     word_count: int = 1500,
     h2_count: int = 3,
     internal_links_count: int = 3,
-    external_refs_count: int = 2
+    external_refs_count: int = 2,
+    keyword_in_h2: bool = True
 ) -> Article:
-    body_markdown = f"# {h1}\n\n"
-    
+    parts = [
+        f"# {h1}",
+        f"An introduction covering {primary_keyword} in the opening paragraph."
+    ]
+
     for i in range(h2_count):
-        body_markdown += f"## Section {i+1}\n\n"
-        body_markdown += "Some content here. " * 50 + "\n\n"
-    
+        if keyword_in_h2:
+            parts.append(f"## Section {i+1} about {primary_keyword}")
+        else:
+            parts.append(f"## Section {i+1}")
+        parts.append(" ".join(_LOREM_WORDS[:150]))
+
+    body_markdown = "\n\n".join(parts)
+
     current_words = len(body_markdown.split())
     if current_words < word_count:
-        body_markdown += "Additional content. " * (word_count - current_words)
+        body_markdown += "\n\n" + " ".join(_LOREM_WORDS[:word_count - current_words])
     elif current_words > word_count:
-        words = body_markdown.split()[:word_count]
-        body_markdown = " ".join(words)
-    
+        body_markdown = " ".join(body_markdown.split()[:word_count])
+
     internal_links = [
         InternalLinkSuggestion(anchor_text=f"Link {i+1}", target_slug=f"link-{i+1}")
         for i in range(internal_links_count)
@@ -117,6 +130,58 @@ def test_validator_too_few_external_references():
     assert any("external references" in error.lower() for error in errors)
 
 
+def test_validator_single_word_keyword_in_h1_not_required_in_h2():
+    validator = SEOValidator()
+    article = create_test_article(
+        h1="Test Article About Testing",
+        primary_keyword="test",
+        keyword_in_h2=False
+    )
+    errors = validator.validate(article)
+    assert errors == []
+
+
+def test_validator_multi_word_keyword_still_required_in_h2():
+    validator = SEOValidator()
+    article = create_test_article(
+        h1="Guide to unit testing",
+        primary_keyword="unit testing",
+        keyword_in_h2=False
+    )
+    errors = validator.validate(article)
+    assert any("H2" in error for error in errors)
+
+
+def test_validator_fast_mode_returns_first_error_only():
+    validator = SEOValidator()
+    article = create_test_article(
+        h1="Different Title",
+        primary_keyword="test",
+        internal_links_count=0,
+        external_refs_count=0
+    )
+    fast_errors = validator.validate(article, fast=True)
+    assert len(fast_errors) == 1
+
+    # A partial fast result must not be cached: the follow-up full
+    # validation still reports every failing check.
+    full_errors = validator.validate(article)
+    assert len(full_errors) > 1
+    assert full_errors[0] == fast_errors[0]
+
+
+def test_validate_many_matches_individual_validation():
+    validator = SEOValidator()
+    articles = [
+        create_test_article(h1="Test Article About Testing", primary_keyword="test"),
+        create_test_article(h1="Different Title", primary_keyword="test"),
+        create_test_article(h1="Test Article", primary_keyword="test", internal_links_count=1),
+    ]
+    expected = [SEOValidator().validate(article) for article in articles]
+    assert validator.validate_many(articles) == expected
+    assert validator.validate_many([]) == []
+
+
 def test_validator_valid_article_passes():
     validator = SEOValidator()
     article = create_test_article(
@@ -128,10 +193,6 @@ def test_validator_valid_article_passes():
         external_refs_count=2
     )
 
-    words = article.body_markdown.split()
-    words[:10] = ["test"] * 10
-    article.body_markdown = " ".join(words)
-    
     errors = validator.validate(article)
     assert len(errors) == 0
 